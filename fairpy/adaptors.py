@@ -11,6 +11,7 @@ Since: 2022-10
 """
 
 from typing import Callable, Any
+from operator import itemgetter
 from fairpy import AgentList, Allocation, ValuationMatrix, AllocationMatrix, FractionalBundle
 import numpy as np
 
@@ -151,65 +152,138 @@ def divide(algorithm: Callable, input: Any, *args, **kwargs):
     ### Convert input to ValuationMatrix
     elif first_argument_type==ValuationMatrix:
         # Step 1. Adapt the input:
-        valuation_matrix = list_of_valuations = object_names = agent_names = None
-        if isinstance(input, ValuationMatrix): # instance is already a valuation matrix
-            valuation_matrix = input
-        elif isinstance(input, np.ndarray):    # instance is a numpy valuation matrix
-            valuation_matrix = ValuationMatrix(input)
-        elif isinstance(input, list) and isinstance(input[0], list):            # list of lists
-            list_of_valuations = input
-            valuation_matrix = ValuationMatrix(list_of_valuations)
-        elif isinstance(input, dict):  
-            agent_names = list(input.keys())
-            list_of_valuations = list(input.values())
-            if isinstance(list_of_valuations[0], dict): # maps agent names to dicts of valuations
-                object_names = list(list_of_valuations[0].keys())
-                list_of_valuations = [
-                    [valuation[object] for object in object_names]
-                    for valuation in list_of_valuations
-                ]
-            valuation_matrix = ValuationMatrix(list_of_valuations)
-        else:
-            raise TypeError(f"Unsupported input type: {type(input)}")
+        agent_names, object_names, valuation_matrix = _adapt_input_to_valuation_matrix(input)
 
         # Step 2. Run the algorithm:
         output = algorithm(valuation_matrix, *args, **kwargs)
         # Step 3. Adapt the output:
-        if isinstance(output,Allocation):
-            return output
+        return _adapt_output_to_allocation(output, input, agent_names, object_names, valuation_matrix)
+
+    else:
+        return algorithm(input, *args, **kwargs)
+
+
+def _valuation_matrix_from_valuation_matrix(input: ValuationMatrix):
+    return None, None, input    # instance is already a valuation matrix
+
+def _valuation_matrix_from_ndarray(input: np.ndarray):
+    return None, None, ValuationMatrix(input)
+
+def _valuation_matrix_from_list(input: list):
+    if not isinstance(input[0], list):
+        raise TypeError(f"Unsupported input type: {type(input)}")
+    return None, None, ValuationMatrix(np.asarray(input))
+
+def _valuation_matrix_from_dict(input: dict):
+    agent_names = list(input.keys())
+    list_of_valuations = list(input.values())
+    object_names = None
+    if isinstance(list_of_valuations[0], dict): # maps agent names to dicts of valuations
+        object_names = list(list_of_valuations[0].keys())
+        if len(object_names) == 0:   # itemgetter requires at least one object
+            list_of_valuations = [()] * len(list_of_valuations)
+        else:
+            # itemgetter builds all the values of an agent in a single call
+            list_of_valuations = list(map(itemgetter(*object_names), list_of_valuations))
+            if len(object_names) == 1:   # itemgetter of a single object returns a value rather than a tuple
+                list_of_valuations = [(value,) for value in list_of_valuations]
+    return agent_names, object_names, ValuationMatrix(np.asarray(list_of_valuations))
+
+# Maps the exact type of an input to the function that converts it to a ValuationMatrix.
+# The order matters for the isinstance fallback, which handles subclasses.
+_VALUATION_MATRIX_ADAPTORS = {
+    ValuationMatrix: _valuation_matrix_from_valuation_matrix,
+    np.ndarray: _valuation_matrix_from_ndarray,
+    list: _valuation_matrix_from_list,
+    dict: _valuation_matrix_from_dict,
+}
+
+def _adapt_input_to_valuation_matrix(input: Any):
+    """
+    Convert the input of `divide` to a ValuationMatrix.
+
+    :return: a tuple (agent_names, object_names, valuation_matrix); the names are None if the input does not contain them.
+
+    >>> agent_names, object_names, valuation_matrix = _adapt_input_to_valuation_matrix([[1,2],[3,4]])
+    >>> agent_names, object_names
+    (None, None)
+    >>> valuation_matrix
+    [[1 2]
+     [3 4]]
+    >>> agent_names, object_names, valuation_matrix = _adapt_input_to_valuation_matrix({"Alice": {"x":1,"y":2}, "George": {"x":3,"y":4}})
+    >>> agent_names, object_names
+    (['Alice', 'George'], ['x', 'y'])
+    >>> valuation_matrix
+    [[1 2]
+     [3 4]]
+    >>> agent_names, object_names, valuation_matrix = _adapt_input_to_valuation_matrix({"Alice": {"x":1}, "George": {"x":3}})
+    >>> valuation_matrix
+    [[1]
+     [3]]
+    >>> agent_names, object_names, valuation_matrix = _adapt_input_to_valuation_matrix({"Alice": {}, "George": {}})
+    >>> agent_names, object_names
+    (['Alice', 'George'], [])
+    >>> valuation_matrix.num_of_agents, valuation_matrix.num_of_objects
+    (2, 0)
+    >>> _adapt_input_to_valuation_matrix("xy")
+    Traceback (most recent call last):
+    ...
+    TypeError: Unsupported input type: <class 'str'>
+    """
+    adaptor = _VALUATION_MATRIX_ADAPTORS.get(type(input), None)
+    if adaptor is None:
+        for input_type, input_type_adaptor in _VALUATION_MATRIX_ADAPTORS.items():
+            if isinstance(input, input_type):
+                adaptor = input_type_adaptor
+                break
+        else:
+            raise TypeError(f"Unsupported input type: {type(input)}")
+    return adaptor(input)
+
+
+
+def _adapt_output_to_allocation(output: Any, input: Any, agent_names: list, object_names: list, valuation_matrix: ValuationMatrix) -> Allocation:
+    """
+    Convert the output of an algorithm that accepts a ValuationMatrix to an Allocation.
+
+    :param output: the output of the algorithm: an Allocation, an allocation matrix, or a list of bundles.
+    :param input, agent_names, object_names, valuation_matrix: the original input to `divide`, and its adaptation by `_adapt_input_to_valuation_matrix`.
+    """
+    if isinstance(output,Allocation):
+        return output
+    if isinstance(output, np.ndarray) or isinstance(output, AllocationMatrix):  # allocation matrix
+        allocation_matrix = output if isinstance(output, AllocationMatrix) else AllocationMatrix(output)
+        if isinstance(input, dict):
+            list_of_bundles = [FractionalBundle(allocation_matrix[i], object_names) for i in allocation_matrix.agents()]
+            dict_of_bundles = dict(zip(agent_names,list_of_bundles))
+            return Allocation(input, dict_of_bundles, matrix=allocation_matrix)
+        else:
+            return Allocation(valuation_matrix, allocation_matrix)
+    elif isinstance(output, list):
         if agent_names is None:
             agent_names = [f"Agent #{i}" for i in valuation_matrix.agents()]
-        if isinstance(output, np.ndarray) or isinstance(output, AllocationMatrix):  # allocation matrix
-            allocation_matrix = AllocationMatrix(output)
-            if isinstance(input, dict):
-                list_of_bundles = [FractionalBundle(allocation_matrix[i], object_names) for i in allocation_matrix.agents()]
-                dict_of_bundles = dict(zip(agent_names,list_of_bundles))
-                return Allocation(input, dict_of_bundles, matrix=allocation_matrix)
-            else:
-                return Allocation(valuation_matrix, allocation_matrix)
-        elif isinstance(output, list):
-            if object_names is None:
-                list_of_bundles = output
-            else:
-                list_of_bundles = [
-                    [object_names[object_index] for object_index in bundle]
-                    for bundle in output
-                ]
-            dict_of_bundles = dict(zip(agent_names,list_of_bundles))
-            return Allocation(input if isinstance(input,dict) else valuation_matrix, dict_of_bundles)
+        if object_names is None:
+            list_of_bundles = output
         else:
-            raise TypeError(f"Unsupported output type: {type(output)}")
-
+            list_of_bundles = [
+                [object_names[object_index] for object_index in bundle]
+                for bundle in output
+            ]
+        dict_of_bundles = dict(zip(agent_names,list_of_bundles))
+        return Allocation(input if isinstance(input,dict) else valuation_matrix, dict_of_bundles)
     else:
-        return algorithm(input, *args, **kwargs)
+        raise TypeError(f"Unsupported output type: {type(output)}")
 
 
 
 if __name__ == "__main__":
     # from fairpy.items.round_robin import round_robin
     # print(divide(algorithm=round_robin, instance = [[11,22,44,0],[22,11,66,33]]))
-    import doctest, sys
-    (failures, tests) = doctest.testmod(report=True)
-    print(f"{failures} failures, {tests} tests")
-    # if failures > 0:
-    #     sys.exit(1)
+    # The doctests exercise many algorithms, so they run only on request (e.g. RUN_DOCTESTS=1 python adaptors.py);
+    # pytest runs them anyway via --doctest-modules.
+    import doctest, os, sys
+    if os.environ.get("RUN_DOCTESTS"):
+        (failures, tests) = doctest.testmod(report=True)
+        print(f"{failures} failures, {tests} tests")
+        # if failures > 0:
+        #     sys.exit(1)
@@ -58,6 +58,9 @@ class Agent(ABC):
     def partition_values(self, partition:list)->float:
         return self.valuation.partition_values(partition)
 
+    def intervals_values(self, intervals:list)->list:
+        return self.valuation.intervals_values(intervals)
+
     def all_items(self):
         return self.valuation.all_items()
 
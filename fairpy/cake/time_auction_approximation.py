@@ -16,6 +16,7 @@ Since: 2019-12
 from fairpy import Allocation, AgentList, Agent, PiecewiseConstantAgent
 
 import random, logging
+import numpy as np
 from typing import *
 from networkx import *
 from math import *
@@ -91,12 +92,12 @@ def equally_sized_pieces(agents: AgentList, piece_size: float) -> Allocation:
 
     # Evaluating the pieces of the partition for every agent there is
     logger.info("For each piece (in both partitions) and agent: compute the agent's value of the piece.")
-    evaluations = {}
-    # Get evaluation for every piece
-    for piece in normalize_partitions:
-        # For every piece get evaluation for every agent
-        for agent in agents:
-            evaluations[(agent, piece)] = agent.eval(start=piece[0], end=piece[1])
+    # Each agent evaluates all the pieces in a single query
+    evaluations = {
+        (agent, piece): value
+        for agent in agents
+        for piece, value in zip(normalize_partitions, agent.intervals_values(normalize_partitions))
+    }
     # Create the matching graph
     # One side is the agents, the other side is the partitions and the weights are the evaluations
     logger.info("Create the partition graphs G_0_l and G_d_l")
@@ -171,14 +172,12 @@ def discrete_setting(agents: AgentList, pieces: List[Tuple[float, float]]) -> Al
         partition_i = change_partition(pieces, t)
 
         logger.info("For each piece and agent: compute the agent's value of the piece.")
-        # Evaluate every piece in the new partition
-        evaluations = {}
-        # Go over every piece in the partition
-        for piece in partition_i:
-            # Go over each Agent
-            for agent in agents:
-                # Evaluate the piece according to the Agent
-                evaluations[(agent, piece)] = agent.eval(start=piece[0], end=piece[1])
+        # Evaluate every piece in the new partition - each agent evaluates all pieces in a single query
+        evaluations = {
+            (agent, piece): value
+            for agent in agents
+            for piece, value in zip(partition_i, agent.intervals_values(partition_i))
+        }
 
         logger.info("create the partition graph G - Pt=%d", t)
         # Create the matching graph according to the new partition
@@ -283,20 +282,24 @@ def create_partition(size: float, start: float=0) -> List[Tuple[float, float]]:
     :return: A partition as described.
 
     >>> create_partition(0.5, 0)
-    [(0, 0.5), (0.5, 1.0)]
+    [(0.0, 0.5), (0.5, 1.0)]
+    >>> create_partition(0.25, 0.5)
+    [(0.5, 0.75), (0.75, 1.0)]
+    >>> create_partition(0.6, 0.5)
+    []
+    >>> len(create_partition(1/93)), len(create_partition(1/99)), len(create_partition(0.01))
+    (93, 99, 100)
+    >>> create_partition(1/3 + 1e-12)[-1][1]
+    1.0
 
     """
-    #print("create_partition: size- ", size, "start- ", start)
-    res = []
-    end = start + size
-    # Iterate until we divide all the cake into pieces
-    while end <= 1:
-        # add the piece to the list
-        res.append((start, end))
-        start = end
-        end = start + size
-    #print("create_partition: return value- ", res)
-    return res
+    # The number of whole pieces that fit between start and 1; the tolerance keeps a quotient such as 92.99999999999999 from being truncated
+    num_of_pieces = max(0, int((1 - start) / size + 1e-9))
+    # Computing each boundary directly (rather than by repeated addition) avoids accumulating rounding errors
+    starts = start + size * np.arange(num_of_pieces)
+    # The tolerance above may admit a last piece that ends a hair beyond the cake, so it is cut at 1
+    ends = np.minimum(starts + size, 1.0)
+    return list(zip(starts.tolist(), ends.tolist()))
 
 
 def fix_edges(edges_set: Set[Tuple[Agent, Tuple[float, float]]]) -> Set[Tuple[Agent, Tuple[float, float]]]:
@@ -400,9 +403,8 @@ def create_matching_graph(left: AgentList, right: List[Tuple[float, float]],
     g.add_nodes_from(left, bipartite=0)
     # Set the right side of the graph to be the partitions
     g.add_nodes_from(right, bipartite=1)
-    # Set the edges of the graph with their weights
-    for key, value in weights.items():
-        g.add_edge(key[0], key[1], weight=value)
+    # Set the edges of the graph with their weights, all in a single call
+    g.add_weighted_edges_from((agent, piece, value) for (agent, piece), value in weights.items())
     return g
 
 
@@ -85,6 +85,18 @@ class Valuation(ABC):
         values.append(self.eval(partition[-1], self.cake_length()))
         return values
 
+    def intervals_values(self, intervals:List[tuple]):
+        """
+        Evaluate several (possibly overlapping) intervals.
+        :param intervals: a list of tuples [(start1,end1), (start2,end2),...]
+        :return: a list of values: eval(start1,end1), eval(start2,end2), ...
+
+        >>> a = PiecewiseConstantValuation([1,2,3,4])
+        >>> a.intervals_values([(0,2), (1,3), (2,2)])
+        [3.0, 5.0, 0.0]
+        """
+        return [self.eval(*interval) for interval in intervals]
+
 
 class PiecewiseConstantValuation(Valuation):
     """
@@ -159,6 +171,28 @@ class PiecewiseConstantValuation(Valuation):
 
         return val
 
+    def intervals_values(self, intervals:List[tuple]):
+        """
+        Evaluate several intervals at once, using the cumulative values of the segments:
+        the value of [start,end] is the cumulative value at end minus the cumulative value at start.
+        With integer values the result equals eval; with non-integer values the subtraction
+        of cumulative sums may differ from eval by floating-point rounding.
+
+        >>> a = PiecewiseConstantValuation([11,22,33,44])
+        >>> a.intervals_values([(1,3), (1.5,3), (1,3.25), (1.5,3.25), (3,3), (3,7), (-1,7)])
+        [55.0, 44.0, 66.0, 55.0, 0.0, 44.0, 110.0]
+        >>> a.intervals_values([])
+        []
+        """
+        if len(intervals) == 0:
+            return []
+        # the cake to the left of 0 and to the right of length is considered worthless.
+        starts, ends = np.clip(np.array(intervals, dtype=float), 0, self.length).T
+        segment_bounds = np.arange(self.length + 1)
+        cumulative_values = np.concatenate(([0], np.cumsum(self.values)))
+        values = np.interp(ends, segment_bounds, cumulative_values) - np.interp(starts, segment_bounds, cumulative_values)
+        return np.where(ends > starts, values, 0.0).tolist()
+
     def mark(self, start:float, target_value:float):
         """
         Answer a Mark query: return "end" such that the value of the interval [start,end] is target_value.
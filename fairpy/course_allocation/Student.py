@@ -1,10 +1,9 @@
-from copy import deepcopy
 from Course import Course
 class Student:
-    def __init__(self,name, budget, preferences, courses = [], year=1):
+    def __init__(self,name, budget, preferences, courses = None, year=1):
         self.name = name
         self.budget = budget
-        self.courses = courses
+        self.courses = [] if courses is None else courses
         self.preferences = preferences   
         self.year = year 
 
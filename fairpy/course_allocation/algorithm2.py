@@ -62,14 +62,9 @@ def csp_mapping(students,courses):
         if(not flag):
             break
 def copy_students(students):
-    list_copy = []
-    for s in students:
-        a = copy.deepcopy(s)
-        a.preferences = []
-        for pre in s.preferences:
-            a.preferences.append(pre)
-        list_copy.append(a)
-    return list_copy
+    # Only the budget and the enrolled courses change during mapping, so the Course objects are shared rather than deep-copied
+    return [Student(name=s.name, budget=s.budget, preferences=list(s.preferences), courses=list(s.courses), year=s.year)
+            for s in students]
 
 def get_demand_vector(courses):
     lst = []
@@ -1,4 +1,4 @@
-from algorithm2 import algorithm2,Course,Student,csp_mapping,copy,math,cmp_to_key
+from algorithm2 import algorithm2,Course,Student,csp_mapping,copy_students,copy,math,cmp_to_key
 
 def test_1(): 
     a = Course(name='a', price=9, max_capacity=5)
@@ -53,6 +53,23 @@ def test_3():
     price_vector = [3,4,3]
     assert(algorithm2(price_vector, maximum, eps, csp_mapping, students, courses)==[3,4,3])
 
+def test_4():
+    # A copied student keeps the very Course objects it is enrolled in, so it does not take an enrolled course again
+    a = Course(name='a', price=5, max_capacity=1)
+    b = Course(name='b', price=18, max_capacity=3)
+    courses = [a, b]
+    s1 = Student(name='s1', budget=15, courses=[a], preferences=([a, b]))
+    s2 = Student(name='s2', budget=20, preferences=([a, b]))
+    students = [s1, s2]
+    copied = copy_students(students)
+    csp_mapping(copied, courses)
+    assert [[course.name for course in s.courses] for s in copied] == [['a'], ['a']]
+    assert [s.budget for s in copied] == [15, 15]
+    assert [str(course) for course in courses] == ['course name: a capacity 1/1 and priced 5', 'course name: b capacity 0/3 and priced 18']
+    # the original students are not changed
+    assert s1.courses == [a] and s1.budget == 15
+    assert s2.courses == [] and s2.budget == 20
+
 if __name__=="__main__":
     import pytest
     pytest.main(args=["fairpy/course_allocation"])
\ No newline at end of file
@@ -10,49 +10,67 @@ Since:  2023-01
 
 
 import time
-import random
+import numpy as np
 from Course import Course
 from Student import Student
 from functools import cmp_to_key
 import fairpy.adaptors as adaptors
-from algorithm1 import algorithm1, random, TabuList, copy, map_price_demand, reset_update_prices, cmp_to_key, reset_students, time
+from algorithm1 import algorithm1, TabuList, copy, map_price_demand, reset_update_prices, cmp_to_key, reset_students, time
 from algorithm2 import algorithm2, csp_mapping, copy, math, cmp_to_key
 from algorithm3 import algorithm3, mapping_csp
 
 
 def get_courses_students_matrix(students, courses):
-    # Initialize the matrix with all False values
-    matrix = [[False for _ in courses] for _ in students]
-
-    # Loop through each student and mark the courses they are enrolled in as True
-    for i, student in enumerate(students):
-        for course in student.courses:
-            j = courses.index(course)
-            matrix[i][j] = True
-
+    '''
+    Return a boolean matrix M in which M[i][j] is True iff student i is enrolled in course j.
+
+    >>> a = Course(name='a', price=0, max_capacity=5)
+    >>> b = Course(name='b', price=0, max_capacity=3)
+    >>> c = Course(name='c', price=0, max_capacity=5)
+    >>> s1 = Student(name='s1', budget=15, courses=[c], preferences=([c, b]))
+    >>> s2 = Student(name='s2', budget=15, courses=[a, b], preferences=([b, c, a]))
+    >>> get_courses_students_matrix([s1, s2], [a, b, c])
+    array([[False, False,  True],
+           [ True,  True, False]])
+    '''
+    # Map each course to its column once, instead of searching the course list for every enrollment
+    course_to_index = {course: j for j, course in enumerate(courses)}
+    # Collect the (student, course) index pairs of all enrollments, and mark them all in a single store
+    rows = [i for i, student in enumerate(students) for _ in student.courses]
+    cols = [course_to_index[course] for student in students for course in student.courses]
+    matrix = np.zeros((len(students), len(courses)), dtype=bool)
+    matrix[rows, cols] = True
     return matrix
 
 
 if __name__ == '__main__':
-    # random.seed(3)
+    # rng = np.random.default_rng(3)
+    rng = np.random.default_rng()
     start_time = time.time()
     # Generate 10 courses
+    num_of_courses = 10
+    # Draw the random fields of all courses at once
+    max_capacities = rng.integers(3, 10, size=num_of_courses, endpoint=True)
     courses = []
-    for j in range(10):
+    for j in range(num_of_courses):
         name = chr(ord('a') + j)
         price = 0
         capacity = 0
-        max_capacity = random.randint(3, 10)
+        max_capacity = int(max_capacities[j])
         courses.append(Course(name=name,price=price,
             capacity=capacity, max_capacity=max_capacity))
 
     # Generate 40 students
+    num_of_students = 40
+    # Draw the random fields of all students at once
+    years = rng.integers(1, 4, size=num_of_students, endpoint=True)
+    num_of_preferences = rng.integers(3, 7, size=num_of_students, endpoint=True)
     students = []
-    for k in range(40):
+    for k in range(num_of_students):
         name = 's' + str(k+1)
         budget = 20
-        year = random.randint(1, 4)
-        preferences = random.sample(courses, random.randint(3, 7))
+        year = int(years[k])
+        preferences = [courses[j] for j in rng.choice(num_of_courses, size=num_of_preferences[k], replace=False)]
         students.append(Student(name=name, budget=budget,
             year=year, courses=courses, preferences=preferences))
 
@@ -64,7 +82,8 @@ if __name__ == '__main__':
     map_price_demand(price_vector=price_vector1, courses=courses,
         max_budget=max_budget, students=students)
     p_scalar = (max_budget)
-    price_vector2 =adaptors.divide(algorithm2,input=[course.price for course in courses],maximum=p_scalar,
+    # map_price_demand has just set the course prices to price_vector1, so there is no need to collect them again
+    price_vector2 =adaptors.divide(algorithm2,input=price_vector1,maximum=p_scalar,
         eps=0.5, csp_mapping=csp_mapping, students=students, courses=courses)
     # price_vector2 = algorithm2(price_vector=[course.price for course in courses], maximum=p_scalar,
     #     eps=0.5, csp_mapping=csp_mapping, students=students, courses=courses)
@@ -13,8 +13,8 @@ Since: 2022-12
 
 from fairpy import ValuationMatrix
 
-import networkx as nx
 import numpy as np
+from scipy.optimize import linear_sum_assignment
 import pprint
 import logging
 
@@ -103,7 +103,7 @@ class BiddingForEnvyFreeness:
         self.players_order = self.find_best_matching()
         logger.debug(f'\n----------[ INFO ]----------\nFound best players order:\n{pprint.pformat(self.players_order)}\n----------------------------')
         
-        self.players_bids_for_bundles = ValuationMatrix([self.players_bids_for_bundles[i] for i in self.players_order])
+        self.players_bids_for_bundles = ValuationMatrix(self.players_bids_for_bundles._v[self.players_order])
         logger.debug(f'\n----------[ INFO ]----------\nReordered players bids for bundles matrix:\n{pprint.pformat(self.players_bids_for_bundles)}\n----------------------------')
         
                 
@@ -127,7 +127,7 @@ class BiddingForEnvyFreeness:
     def find_best_matching(self, matrix: ValuationMatrix = None) -> list:
         '''
         Find the best matching for the given bidding matrix.
-        Using NetworkX maximum_weight_matching algorithm, which finds the maximum weight matching in a bipartite graph.
+        Using SciPy linear_sum_assignment algorithm, which finds a maximum weight perfect matching in a bipartite graph.
         For applying the algorithm on our data, the following conversion is done:
             consider 2 sides of the bipartite graph: A, B, such that:
             A is the set of players, B is the set of bundles.
@@ -137,7 +137,7 @@ class BiddingForEnvyFreeness:
             which each index of the list is a player and the value of the index is the allocated bundle for the player.
                     
         reference: 
-        https://networkx.org/documentation/stable/reference/algorithms/generated/networkx.algorithms.matching.max_weight_matching.html
+        https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.linear_sum_assignment.html
         
         :param matrix: a matrix of players bids for bundles.
         :return: a list of allocated bundles for each player.
@@ -174,28 +174,16 @@ class BiddingForEnvyFreeness:
         '''
         if matrix is None:
             matrix = self.players_bids_for_bundles
+            
+        elif not isinstance(matrix, ValuationMatrix):
+            matrix = ValuationMatrix(matrix)
         
-        # Initializing the graph
-        g = nx.Graph()
-        
-        # Creating the edges by bids
-        edges = [(f'p{player}', f'b{bundle}', matrix[bundle][player]) for player in range(matrix.num_of_agents) for bundle in range(matrix.num_of_objects)]
-        
-        # Adding the edges to the graph
-        g.add_weighted_edges_from(edges)
-        
-        # Finding the maximum weight matching
-        matching = nx.max_weight_matching(g)
-        
-        # Sorting the tuples to a form of (player, bundle)
-        matching = [sorted(m, reverse=True) for m in matching]
-        
-        # Sorting the tuples by player number
-        matching = sorted(matching, key=lambda x: int(x[0][1:]))
+        # The weight of the edge (player, bundle) is matrix[bundle][player], so the players are the columns
+        _, matching = linear_sum_assignment(matrix._v.T, maximize=True)
         
         # Returning the allocated bundles for each player as a list of integers
         # each index of the list is a player and the value of the index is the allocated bundle for the player.
-        return [int(m[1][1:]) for m in matching]
+        return matching.tolist()
     
         
     def find_m_c(self, matrix: ValuationMatrix = None) -> tuple:
@@ -242,10 +230,10 @@ class BiddingForEnvyFreeness:
             matrix = ValuationMatrix(matrix)
         
         # M is the diagonal sum of the matrix, which represents the sum of the players' bids for their allocated bundles
-        m = sum([matrix[Bi][Bi] for Bi in range(matrix.num_of_agents)])
+        m = np.trace(matrix._v)
         
         # C is the minimum sum of a row, which represents the minimum sum of single player's bids for all bundles
-        c = min([sum(matrix[ci]) for ci in range(matrix.num_of_agents)])
+        c = np.min(matrix.total_values())
         
         return m, c, m-c
     
@@ -285,20 +273,18 @@ class BiddingForEnvyFreeness:
         # for tests, debugging and standalone use
         if matrix is None:
             matrix = self.players_bids_for_bundles            
+            
+        elif not isinstance(matrix, ValuationMatrix):
+            matrix = ValuationMatrix(matrix)
 
         
         # creating the assessment matrix, each players enviness is:
         #   ( his bid for a bundle ( [player, bid] ) ) - ( the accepted bid for that bundle ( [bid, bid] ) )
-        assessment_matrix = [
-            [matrix[player][bid] - matrix[bid][bid] 
-             for bid in range(matrix.num_of_objects)]
-            for player in range(matrix.num_of_agents)]
+        # the diagonal is broadcast as a row, so it is subtracted from each column at once
+        assessment_matrix = matrix._v - np.diag(matrix._v)
         
         # adding a row of zeros to the end of the matrix for the initial players discounts
-        assessment_matrix.append([0 for _ in range(matrix.num_of_agents)])
-        
-        # returning the assessment matrix as a numpy array
-        return np.array(assessment_matrix)
+        return np.vstack([assessment_matrix, np.zeros(matrix.num_of_agents, dtype=assessment_matrix.dtype)])
     
     def compensation_procedure(self, assessment_matrix: np.ndarray = None, MC: int = None) -> np.ndarray:
         '''
@@ -312,10 +298,12 @@ class BiddingForEnvyFreeness:
             assessment_matrix = self.assessment_matrix
             MC = self.MC
 
+        # each player's assessments of all bundles, and of his own bundle
+        players_assessments = assessment_matrix[:-1]
+        own_assessments = np.diag(players_assessments)
+
         # if all players enviness is less or equal to zero, return the assessment matrix
-        if all(
-            [all([x <= assessment_matrix[player][player] for x in assessment_matrix[player]]) for player in range(len(assessment_matrix)-1)]
-            ):
+        if np.all(players_assessments <= own_assessments[:, None]):
             
             # adding the remaining MC to the last row of the assessment matrix (the players discounts) evenly
             assessment_matrix[-1, :] += int((self.MC - sum(self.assessment_matrix[-1, :])) / self.players_bids_for_bundles.num_of_agents)
@@ -329,14 +317,12 @@ class BiddingForEnvyFreeness:
             
             logger.debug(f'\n----------< DEBUG (compensation_procedure) >----------\nCompensation procedure started with assessment matrix:\n{pprint.pformat(assessment_matrix)}\n------------------------------------------------------')
             
-            # finding the maximum enviness of each player, if exists. else - zero
-            compansations = [max(assessment_matrix[player]) - assessment_matrix[player][player] if any([x > assessment_matrix[player][player] for x in assessment_matrix[player]]) else 0 for player in range(len(assessment_matrix)-1)]
+            # finding the maximum enviness of each player, if exists. else - zero (the player's own assessment is the maximum)
+            compansations = np.max(players_assessments, axis=1) - own_assessments
             logger.debug(f'\n----------< DEBUG (compensation_procedure) >----------\nCompansations:\n{pprint.pformat(compansations)}\n------------------------------------------------------')
             
-           # adding the compansations to the assessment matrix
-            for compansation in range(len(compansations)):
-                # adding the compansation to the player's column
-                assessment_matrix[:, compansation] += compansations[compansation]
+            # adding the compansations to the assessment matrix - each compansation to the player's column
+            assessment_matrix += compansations
             logger.debug(f'\n----------< DEBUG (compensation_procedure) >----------\nCompensation procedure finished with assessment matrix:\n{pprint.pformat(assessment_matrix)}\n------------------------------------------------------')
             
             # if total discount is greater than MC, raise an exception
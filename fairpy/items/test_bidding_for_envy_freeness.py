@@ -15,27 +15,27 @@ def test_find_best_matching():
     '''
     matrix = ValuationMatrix([[50, 40, 35], [25, 25, 25], [10, 20, 25]])
     bfef = BiddingForEnvyFreeness(matrix)
-    assert bfef.find_best_matching(ValuationMatrix(matrix)) == [0, 1, 2]
+    assert bfef.find_best_matching(matrix) == [0, 1, 2]
     
     matrix = ValuationMatrix([[25, 25, 25], [50, 40, 35], [10, 20, 25]])
     bfef = BiddingForEnvyFreeness(matrix)
-    assert bfef.find_best_matching(ValuationMatrix(matrix)) == [1, 0, 2]
+    assert bfef.find_best_matching(matrix) == [1, 0, 2]
     
     matrix = ValuationMatrix([[25, 25, 25], [10, 20, 25], [50, 40, 35]])
     bfef = BiddingForEnvyFreeness(matrix)
-    assert bfef.find_best_matching(ValuationMatrix(matrix)) == [2, 0, 1]
+    assert bfef.find_best_matching(matrix) == [2, 0, 1]
     
     matrix = ValuationMatrix([[50, 20, 10, 20], [60, 40, 15, 10], [0, 40, 25, 35], [50, 35, 10, 30]])
     bfef = BiddingForEnvyFreeness(matrix)
-    assert bfef.find_best_matching(ValuationMatrix(matrix)) == [0, 1, 2, 3]
+    assert bfef.find_best_matching(matrix) == [0, 1, 2, 3]
     
     matrix = ValuationMatrix([[60, 40, 15, 10], [50, 20, 10, 20], [0, 40, 25, 35], [50, 35, 10, 30]])
     bfef = BiddingForEnvyFreeness(matrix)
-    assert bfef.find_best_matching(ValuationMatrix(matrix)) == [1, 0, 2, 3]
+    assert bfef.find_best_matching(matrix) == [1, 0, 2, 3]
     
     matrix = ValuationMatrix([[60, 40, 15, 10], [50, 35, 10, 30], [0, 40, 25, 35], [50, 20, 10, 20]])
     bfef = BiddingForEnvyFreeness(matrix)
-    assert bfef.find_best_matching(ValuationMatrix(matrix)) == [3, 0, 2, 1]
+    assert bfef.find_best_matching(matrix) == [3, 0, 2, 1]
     
 
 def test_find_m_c():
@@ -205,13 +205,16 @@ def assert_dict_equal(expected, actual):
         assert expected[key] == actual[key]
 
 def prepare_assertion_for_n_sized(n):
-    import random
-    matrix = [[random.randint(0, 60) for _ in range(n)] for _ in range(n)]
+    matrix = np.random.randint(0, 61, size=(n, n))
     return ValuationMatrix(matrix)
 
 def assert_no_envy(matrix):
-    for i in range(len(matrix) - 1):
-        assert all([j <= matrix[i][i] for j in matrix[i]])
+    '''
+    Assert that no player (row, except the last row of discounts) assesses another bundle above their own.
+    '''
+    matrix = np.asarray(matrix)
+    own_assessments = np.diag(matrix)[:len(matrix) - 1]
+    assert np.all(matrix[:-1] <= own_assessments[:, None])
 
 def run_tests():
     '''